@@ -2,18 +2,27 @@
 Muhurat Router
 Find auspicious timings for various events like marriage, griha pravesh, business, etc.
 """
+import asyncio
+import heapq
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta, time
 from typing import Optional, List
 from enum import Enum
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field, validator
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, Field, TypeAdapter, validator
 
 from services.panchang import PanchangService
 from services.ephemeris import EphemerisService, Nakshatra
 from core.redis_client import cache
 
+import orjson
 import structlog
 
 router = APIRouter(prefix="/muhurat", tags=["muhurat"])
@@ -44,6 +53,55 @@ class EventType(str, Enum):
     UPANAYANA = "upanayana"  # Sacred thread ceremony
 
 
+# Plain string value of each event type, for building messages
+EVENT_TYPE_VALUES = {event_type: event_type.value for event_type in EventType}
+
+# Event type descriptions
+EVENT_DESCRIPTIONS = {
+    EventType.MARRIAGE: "Wedding ceremonies and marriage rituals",
+    EventType.ENGAGEMENT: "Engagement ceremonies and ring exchange",
+    EventType.GRIHA_PRAVESH: "House warming and entering new home",
+    EventType.VEHICLE_PURCHASE: "Buying new vehicles, first drive",
+    EventType.BUSINESS_OPENING: "Starting new business, shop opening",
+    EventType.EDUCATION_START: "Starting education, joining school/college",
+    EventType.TRAVEL: "Long journeys, important trips",
+    EventType.SURGERY: "Medical procedures and operations",
+    EventType.NAMING_CEREMONY: "Naming ceremony for newborn",
+    EventType.PROPERTY_PURCHASE: "Buying land or property",
+    EventType.GOLD_PURCHASE: "Buying gold and jewelry",
+    EventType.INVESTMENT: "Financial investments and contracts",
+    EventType.JOB_JOINING: "Starting new job or position",
+    EventType.FOUNDATION_LAYING: "Laying foundation for construction",
+    EventType.MUNDAN: "First haircut ceremony for children",
+    EventType.ANNAPRASHAN: "First solid food ceremony for infants",
+    EventType.UPANAYANA: "Sacred thread ceremony",
+}
+
+# /event-types body; the event types are fixed so it is serialized once
+EVENT_TYPES_BODY = orjson.dumps([
+    {
+        "type": event_type.value,
+        "name": event_type.value.replace("_", " ").title(),
+        "description": EVENT_DESCRIPTIONS.get(event_type, "")
+    }
+    for event_type in EventType
+])
+
+
+# The 27 nakshatras in order
+NAKSHATRA_NAMES = (
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra", "Punarvasu",
+    "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni", "Hasta",
+    "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha",
+    "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
+    "Uttara Bhadrapada", "Revati",
+)
+NAKSHATRA_INDEX = {name: i for i, name in enumerate(NAKSHATRA_NAMES)}
+
+# Single-bit mask per nakshatra; nakshatra groups below are OR-ed masks
+NAKSHATRA_BITS = {name: 1 << i for name, i in NAKSHATRA_INDEX.items()}
+
+
 # Nakshatras classified by suitability for different activities
 NAKSHATRA_CLASSIFICATIONS = {
     "fixed": ["Rohini", "Uttara Phalguni", "Uttara Ashadha", "Uttara Bhadrapada"],  # For foundations, buying property
@@ -87,6 +145,97 @@ GOOD_TITHIS = {
     EventType.BUSINESS_OPENING: [2, 3, 5, 6, 7, 10, 11, 12, 13],
 }
 
+# Favorable days of week for specific events (0 = Monday)
+FAVORABLE_DAYS = {
+    EventType.MARRIAGE: frozenset({0, 2, 3, 4}),  # Mon, Wed, Thu, Fri
+    EventType.BUSINESS_OPENING: frozenset({0, 2, 3, 4}),
+    EventType.VEHICLE_PURCHASE: frozenset({2, 4, 5}),  # Wed, Fri, Sat
+    EventType.TRAVEL: frozenset({0, 2, 4, 6}),  # Mon, Wed, Fri, Sun
+    EventType.SURGERY: frozenset({1, 5}),  # Tue, Sat
+}
+
+# Events for which evening hours (after 6 PM) are less preferred
+EVENING_RESTRICTED_EVENTS = frozenset({EventType.GRIHA_PRAVESH, EventType.NAMING_CEREMONY})
+
+# Auspicious yogas (by number)
+AUSPICIOUS_YOGAS = frozenset({1, 2, 3, 6, 7, 11, 13, 15, 17, 20, 21, 22, 23, 24, 25, 27})
+GENERAL_AUSPICIOUS_YOGAS = frozenset({1, 2, 3, 6, 7, 11, 13})
+
+
+def _nakshatra_mask(names: List[str]) -> int:
+    """OR together the NAKSHATRA_BITS of the given nakshatras."""
+    mask = 0
+    for name in names:
+        mask |= NAKSHATRA_BITS[name]
+    return mask
+
+
+# Nakshatra groups as bitmasks: membership is `NAKSHATRA_BITS.get(name, 0) & mask`
+NAKSHATRA_CLASSIFICATION_BITS = {k: _nakshatra_mask(v) for k, v in NAKSHATRA_CLASSIFICATIONS.items()}
+EVENT_NAKSHATRA_BITS = {k: _nakshatra_mask(v) for k, v in EVENT_NAKSHATRAS.items()}
+
+# Frozen views of the tithi tables for O(1) membership tests while scoring
+AVOID_TITHIS_SET = {k: frozenset(v) for k, v in AVOID_TITHIS.items()}
+GOOD_TITHIS_SET = {k: frozenset(v) for k, v in GOOD_TITHIS.items()}
+
+# Reason messages, built once so scoring only appends shared strings
+REASON_RIKTA_TITHI = "Rikta tithi - may face obstacles"
+REASON_AMAVASYA = "Amavasya - generally avoided for auspicious activities"
+REASON_VAIDHRITI = "Vaidhriti yoga - use caution"
+REASON_VISHTI = "Vishti (Bhadra) karana - avoid new beginnings"
+REASON_MORNING = "Morning hours are generally auspicious"
+REASON_EVENING = "Evening hours less preferred for this activity"
+REASON_ABHIJIT = "Overlaps with Abhijit Muhurat - highly auspicious"
+REASON_MOVABLE_NAKSHATRA = "Chara (movable) nakshatra"
+REASON_SOFT_NAKSHATRA = "Mridu (soft) nakshatra"
+
+REASON_NAKSHATRA_FAVORABLE = {
+    (event_type, name): f"{name} is highly favorable for {event_type.value}"
+    for event_type, names in EVENT_NAKSHATRAS.items()
+    for name in names
+}
+REASON_NAKSHATRA_DREADFUL = {
+    name: f"{name} is generally not recommended"
+    for name in NAKSHATRA_CLASSIFICATIONS["dreadful"]
+}
+REASON_TITHI_FAVORABLE = {
+    event_type: f"Favorable tithi for {event_type.value}"
+    for event_type in GOOD_TITHIS
+}
+
+# Minimum score for a search window to be reported
+MIN_WINDOW_SCORE = 40
+
+# Search windows: 2-hour slots starting every 30 minutes
+SLOT_DURATION_MINUTES = 120
+SLOT_DURATION = timedelta(minutes=SLOT_DURATION_MINUTES)
+SLOT_STEP = timedelta(minutes=30)
+
+# Slot start offsets from the start of a day's window (covers a full 24 hours)
+SLOT_OFFSETS = tuple(SLOT_STEP * i for i in range(timedelta(days=1) // SLOT_STEP + 1))
+
+# Maximum number of windows returned by a search
+MAX_WINDOWS = 50
+
+# Slot bonuses applied by calculate_slot_adjustment()
+MORNING_BONUS = 5
+ABHIJIT_BONUS = 15
+
+# Largest score calculate_slot_adjustment() can add; search_muhurat skips days
+# that cannot reach MIN_WINDOW_SCORE even with it
+MAX_SLOT_BONUS = MORNING_BONUS + ABHIJIT_BONUS
+
+# Panchang cache: coordinates are rounded to this many decimals (~11 km cells)
+PANCHANG_GRID_PRECISION = 1
+PANCHANG_CACHE_SIZE = 4096
+
+# Maximum number of days whose panchang is computed concurrently per request
+PANCHANG_FETCH_CONCURRENCY = 8
+
+# Dedicated threads for ephemeris work, so it never waits behind (or starves)
+# other blocking calls sharing the event loop's default executor
+PANCHANG_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="panchang")
+
 
 # ============================================================================
 # Pydantic Models
@@ -148,6 +297,29 @@ class MuhuratWindow(BaseModel):
     overlaps_yamagandam: bool
 
 
+@dataclass(slots=True)
+class MuhuratWindowCandidate:
+    """Lightweight search window; only the top ones become MuhuratWindow."""
+    date: date
+    start_time: datetime
+    end_time: datetime
+    duration_minutes: int
+    score: int
+    quality: str
+    tithi: str
+    nakshatra: str
+    yoga: str
+    karana: str
+    reasons_favorable: List[str]
+    reasons_caution: List[str]
+    overlaps_rahu_kalam: bool
+    overlaps_yamagandam: bool
+
+
+# Validates the selected top windows in a single batch
+MUHURAT_WINDOWS_ADAPTER = TypeAdapter(List[MuhuratWindow])
+
+
 class MuhuratSearchResponse(BaseModel):
     event_type: EventType
     search_period: dict
@@ -177,12 +349,37 @@ def calculate_muhurat_score(
     panchang_data,
     event_type: EventType,
     time_slot_start: datetime,
-    time_slot_end: datetime,
-    filters: dict
+    time_slot_end: datetime
 ) -> tuple[int, List[str], List[str]]:
     """
     Calculate muhurat quality score based on panchang elements.
     
+    Returns: (score, favorable_reasons, caution_reasons)
+    """
+    score, favorable, caution = calculate_day_score(
+        panchang_data, event_type, time_slot_start.weekday()
+    )
+    slot_score, slot_favorable, slot_caution = calculate_slot_adjustment(
+        panchang_data, event_type, time_slot_start, time_slot_end
+    )
+    
+    # Cap score between 0 and 100
+    score = max(0, min(100, score + slot_score))
+    
+    return score, favorable + slot_favorable, caution + slot_caution
+
+
+def calculate_day_score(
+    panchang_data,
+    event_type: EventType,
+    weekday: int
+) -> tuple[int, List[str], List[str]]:
+    """
+    Score the panchang elements that are constant for the whole day.
+    
+    The returned score is not capped; combine it with
+    calculate_slot_adjustment() for each time slot of the day.
+    
     Returns: (score, favorable_reasons, caution_reasons)
     """
     score = 50  # Base score
@@ -190,86 +387,92 @@ def calculate_muhurat_score(
     caution = []
     
     nakshatra_name = panchang_data.nakshatra.name
+    nakshatra_bit = NAKSHATRA_BITS.get(nakshatra_name, 0)
     tithi_num = panchang_data.tithi.number
     
     # Nakshatra check (±30 points)
-    event_nakshatras = EVENT_NAKSHATRAS.get(event_type, [])
-    if nakshatra_name in event_nakshatras:
+    if EVENT_NAKSHATRA_BITS.get(event_type, 0) & nakshatra_bit:
         score += 30
-        favorable.append(f"{nakshatra_name} is highly favorable for {event_type.value}")
-    elif nakshatra_name in NAKSHATRA_CLASSIFICATIONS.get("dreadful", []):
+        favorable.append(REASON_NAKSHATRA_FAVORABLE[(event_type, nakshatra_name)])
+    elif NAKSHATRA_CLASSIFICATION_BITS["dreadful"] & nakshatra_bit:
         score -= 30
-        caution.append(f"{nakshatra_name} is generally not recommended")
+        caution.append(REASON_NAKSHATRA_DREADFUL[nakshatra_name])
     else:
         score += 10  # Neutral nakshatra
     
     # Tithi check (±20 points)
-    if tithi_num in AVOID_TITHIS["rikta"]:
+    if tithi_num in AVOID_TITHIS_SET["rikta"]:
         score -= 20
-        caution.append(f"Rikta tithi - may face obstacles")
-    elif tithi_num in AVOID_TITHIS["amavasya"]:
+        caution.append(REASON_RIKTA_TITHI)
+    elif tithi_num in AVOID_TITHIS_SET["amavasya"]:
         score -= 25
-        caution.append("Amavasya - generally avoided for auspicious activities")
-    elif event_type in GOOD_TITHIS and tithi_num in GOOD_TITHIS[event_type]:
+        caution.append(REASON_AMAVASYA)
+    elif event_type in GOOD_TITHIS_SET and tithi_num in GOOD_TITHIS_SET[event_type]:
         score += 20
-        favorable.append(f"Favorable tithi for {event_type.value}")
+        favorable.append(REASON_TITHI_FAVORABLE[event_type])
     else:
         score += 5  # Neutral tithi
     
     # Yoga check (±10 points)
-    auspicious_yogas = [1, 2, 3, 6, 7, 11, 13, 15, 17, 20, 21, 22, 23, 24, 25, 27]
-    if panchang_data.yoga.number in auspicious_yogas:
+    if panchang_data.yoga.number in AUSPICIOUS_YOGAS:
         score += 10
-        favorable.append(f"{panchang_data.yoga.name} yoga is auspicious")
+        favorable.append(_auspicious_yoga_reason(panchang_data.yoga.name))
     elif panchang_data.yoga.number == 27:  # Vaidhriti
         score -= 10
-        caution.append("Vaidhriti yoga - use caution")
+        caution.append(REASON_VAIDHRITI)
     
     # Karana check (±10 points)
     if panchang_data.karana.is_vishti:
         score -= 15
-        caution.append("Vishti (Bhadra) karana - avoid new beginnings")
+        caution.append(REASON_VISHTI)
     else:
         score += 5
     
     # Day of week check
-    favorable_days = {
-        EventType.MARRIAGE: [0, 2, 3, 4],  # Mon, Wed, Thu, Fri
-        EventType.BUSINESS_OPENING: [0, 2, 3, 4],
-        EventType.VEHICLE_PURCHASE: [2, 4, 5],  # Wed, Fri, Sat
-        EventType.TRAVEL: [0, 2, 4, 6],  # Mon, Wed, Fri, Sun
-        EventType.SURGERY: [1, 5],  # Tue, Sat
-    }
+    fav_days = FAVORABLE_DAYS.get(event_type)
+    if fav_days and weekday in fav_days:
+        score += 5
+        favorable.append(_favorable_vara_reason(panchang_data.vara.name, event_type))
+    
+    return score, favorable, caution
+
+
+def calculate_slot_adjustment(
+    panchang_data,
+    event_type: EventType,
+    time_slot_start: datetime,
+    time_slot_end: datetime
+) -> tuple[int, List[str], List[str]]:
+    """
+    Score adjustment for a time slot within the day.
     
-    weekday = time_slot_start.weekday()
-    if event_type in favorable_days:
-        if weekday in favorable_days[event_type]:
-            score += 5
-            favorable.append(f"{panchang_data.vara.name} is good for {event_type.value}")
+    Returns: (score_delta, favorable_reasons, caution_reasons)
+    """
+    score = 0
+    favorable = []
+    caution = []
     
     # Time slot considerations
     # Morning hours (6-10 AM) generally good
     hour = time_slot_start.hour
     if 6 <= hour <= 10:
-        score += 5
-        favorable.append("Morning hours are generally auspicious")
+        score += MORNING_BONUS
+        favorable.append(REASON_MORNING)
     # Avoid late evening (after 6 PM) for some events
-    if hour >= 18 and event_type in [EventType.GRIHA_PRAVESH, EventType.NAMING_CEREMONY]:
+    if hour >= 18 and event_type in EVENING_RESTRICTED_EVENTS:
         score -= 5
-        caution.append("Evening hours less preferred for this activity")
+        caution.append(REASON_EVENING)
     
     # Abhijit muhurat bonus
     if panchang_data.abhijit_start and panchang_data.abhijit_end:
         if time_slot_start <= panchang_data.abhijit_end and time_slot_end >= panchang_data.abhijit_start:
-            score += 15
-            favorable.append("Overlaps with Abhijit Muhurat - highly auspicious")
-    
-    # Cap score between 0 and 100
-    score = max(0, min(100, score))
+            score += ABHIJIT_BONUS
+            favorable.append(REASON_ABHIJIT)
     
     return score, favorable, caution
 
 
+@lru_cache(maxsize=None)
 def get_quality_label(score: int) -> str:
     """Convert score to quality label."""
     if score >= 75:
@@ -297,6 +500,138 @@ def check_time_conflicts(
     return rahu_conflict, yama_conflict
 
 
+@lru_cache(maxsize=None)
+def _auspicious_yoga_reason(yoga_name: str) -> str:
+    """Reason string for an auspicious yoga (memoized)."""
+    return f"{yoga_name} yoga is auspicious"
+
+
+@lru_cache(maxsize=None)
+def _favorable_vara_reason(vara_name: str, event_type: EventType) -> str:
+    """Reason string for a weekday recommended for the event (memoized)."""
+    return f"{vara_name} is good for {EVENT_TYPE_VALUES[event_type]}"
+
+
+@lru_cache(maxsize=256)
+def _zoneinfo(timezone_str: str) -> ZoneInfo:
+    """ZoneInfo for a timezone name, cached across requests."""
+    return ZoneInfo(timezone_str)
+
+
+_panchang_local = threading.local()
+
+
+def _panchang_service() -> PanchangService:
+    """
+    PanchangService for the calling thread, created on first use.
+    
+    One instance per PANCHANG_POOL thread: the ephemeris setup is paid once
+    per thread rather than per computed day, and no instance is shared
+    between threads.
+    """
+    service = getattr(_panchang_local, "service", None)
+    if service is None:
+        service = _panchang_local.service = PanchangService()
+    return service
+
+
+# Panchang LRU cache, keyed by _panchang_key(); most recently used last
+_panchang_cache: OrderedDict = OrderedDict()
+_panchang_cache_lock = threading.Lock()
+
+
+def _panchang_key(date_val: date, latitude: float, longitude: float, timezone_str: str) -> tuple:
+    """
+    Cache key for a date and location: (date, grid cell, timezone).
+    
+    Panchang timings shift only marginally within a grid cell, so nearby
+    locations share one ephemeris calculation (computed at the cell centre).
+    """
+    return (
+        date_val,
+        round(latitude, PANCHANG_GRID_PRECISION),
+        round(longitude, PANCHANG_GRID_PRECISION),
+        timezone_str
+    )
+
+
+def _cached_panchang(key: tuple):
+    """Cached panchang for a key, or None. Never computes, so safe on the event loop."""
+    with _panchang_cache_lock:
+        panchang = _panchang_cache.get(key)
+        if panchang is not None:
+            _panchang_cache.move_to_end(key)
+    return panchang
+
+
+def _compute_panchang(key: tuple):
+    """Compute panchang for a cache key and store it, evicting the least recently used."""
+    date_val, latitude, longitude, timezone_str = key
+    panchang = _panchang_service().get_panchang(
+        date_val=date_val,
+        latitude=latitude,
+        longitude=longitude,
+        timezone_str=timezone_str
+    )
+    with _panchang_cache_lock:
+        _panchang_cache[key] = panchang
+        if len(_panchang_cache) > PANCHANG_CACHE_SIZE:
+            _panchang_cache.popitem(last=False)
+    return panchang
+
+
+async def compute_panchang(date_val: date, latitude: float, longitude: float, timezone_str: str):
+    """
+    Get panchang for a date and location, cached per lat/lon grid cell.
+    
+    A cache hit is answered directly; a miss is computed on PANCHANG_POOL
+    so the event loop is not blocked.
+    """
+    key = _panchang_key(date_val, latitude, longitude, timezone_str)
+    panchang = _cached_panchang(key)
+    if panchang is None:
+        loop = asyncio.get_running_loop()
+        panchang = await loop.run_in_executor(PANCHANG_POOL, _compute_panchang, key)
+    return panchang
+
+
+async def fetch_panchang_range(
+    start_date: date,
+    end_date: date,
+    latitude: float,
+    longitude: float,
+    timezone_str: str
+) -> List[tuple]:
+    """
+    Fetch panchang for every day in a date range (inclusive).
+    
+    Cached days are read directly; only cache misses are computed, on
+    PANCHANG_POOL, at most PANCHANG_FETCH_CONCURRENCY at a time, so the
+    event loop is not blocked while the ephemeris runs.
+    
+    Returns: list of (date, panchang_data) pairs in date order
+    """
+    num_days = (end_date - start_date).days + 1
+    dates = [start_date + timedelta(days=offset) for offset in range(num_days)]
+    keys = [_panchang_key(date_val, latitude, longitude, timezone_str) for date_val in dates]
+    panchangs = [_cached_panchang(key) for key in keys]
+    
+    misses = [index for index, panchang in enumerate(panchangs) if panchang is None]
+    if misses:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(PANCHANG_FETCH_CONCURRENCY)
+        
+        async def compute(key: tuple):
+            async with semaphore:
+                return await loop.run_in_executor(PANCHANG_POOL, _compute_panchang, key)
+        
+        computed = await asyncio.gather(*(compute(keys[index]) for index in misses))
+        for index, panchang in zip(misses, computed):
+            panchangs[index] = panchang
+    
+    return list(zip(dates, panchangs))
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -309,36 +644,34 @@ async def search_muhurat(request: MuhuratSearchRequest):
     Analyzes panchang for each day and identifies suitable time windows
     based on the event type and applied filters.
     """
-    panchang_service = PanchangService()
     windows = []
     
-    current_date = request.start_date
-    while current_date <= request.end_date:
-        # Get panchang for the day
-        panchang_data = panchang_service.get_panchang(
-            date_val=current_date,
-            latitude=request.location.latitude,
-            longitude=request.location.longitude,
-            timezone_str=request.location.timezone
-        )
-        
+    # Get panchang for the whole range concurrently
+    panchang_by_day = await fetch_panchang_range(
+        request.start_date,
+        request.end_date,
+        latitude=request.location.latitude,
+        longitude=request.location.longitude,
+        timezone_str=request.location.timezone
+    )
+    
+    tz = _zoneinfo(request.location.timezone)
+    excluded_nakshatras = frozenset(request.exclude_nakshatras)
+    
+    for current_date, panchang_data in panchang_by_day:
         # Skip if nakshatra is excluded
-        if panchang_data.nakshatra.name in request.exclude_nakshatras:
-            current_date += timedelta(days=1)
+        if panchang_data.nakshatra.name in excluded_nakshatras:
             continue
         
         # Skip if rikta tithi and filter is on
-        if request.avoid_rikta_tithi and panchang_data.tithi.number in AVOID_TITHIS["rikta"]:
-            current_date += timedelta(days=1)
+        if request.avoid_rikta_tithi and panchang_data.tithi.number in AVOID_TITHIS_SET["rikta"]:
             continue
         
         # Skip if bhadra karana and filter is on
         if request.avoid_bhadra and panchang_data.karana.is_vishti:
-            current_date += timedelta(days=1)
             continue
         
         # Define time slots to analyze (2-hour windows)
-        tz = ZoneInfo(request.location.timezone)
         base_start = panchang_data.sunrise
         base_end = panchang_data.sunset
         
@@ -353,43 +686,51 @@ async def search_muhurat(request: MuhuratSearchRequest):
             if preferred_end < base_end:
                 base_end = preferred_end
         
+        # Day-level score is shared by every slot of the day
+        day_score, day_favorable, day_caution = calculate_day_score(
+            panchang_data, request.event_type, base_start.weekday()
+        )
+        
+        # Skip the day if no slot can reach the minimum score
+        if day_score + MAX_SLOT_BONUS < MIN_WINDOW_SCORE:
+            continue
+        
         # Generate time slots
-        slot_duration = 120  # 2 hours
-        current_slot = base_start
+        num_slots = max(0, (base_end - base_start - SLOT_DURATION) // SLOT_STEP + 1)
         
-        while current_slot + timedelta(minutes=slot_duration) <= base_end:
-            slot_end = current_slot + timedelta(minutes=slot_duration)
+        for offset in SLOT_OFFSETS[:num_slots]:
+            current_slot = base_start + offset
+            slot_end = current_slot + SLOT_DURATION
             
             # Check conflicts with inauspicious periods
             rahu_conflict, yama_conflict = check_time_conflicts(
-                current_slot, slot_duration,
+                current_slot, SLOT_DURATION_MINUTES,
                 panchang_data.rahu_kalam_start, panchang_data.rahu_kalam_end,
                 panchang_data.yamagandam_start, panchang_data.yamagandam_end
             )
             
             # Skip if conflicts and filters are on
             if request.avoid_rahu_kalam and rahu_conflict:
-                current_slot += timedelta(minutes=30)
                 continue
             
             if request.avoid_yamagandam and yama_conflict:
-                current_slot += timedelta(minutes=30)
                 continue
             
             # Calculate score
-            score, favorable, caution = calculate_muhurat_score(
-                panchang_data, request.event_type,
-                current_slot, slot_end,
-                request.model_dump()
+            slot_score, slot_favorable, slot_caution = calculate_slot_adjustment(
+                panchang_data, request.event_type, current_slot, slot_end
             )
+            score = max(0, min(100, day_score + slot_score))
             
-            # Only include windows with score >= 40
-            if score >= 40:
-                windows.append(MuhuratWindow(
+            # Only include windows with score >= MIN_WINDOW_SCORE
+            if score >= MIN_WINDOW_SCORE:
+                favorable = day_favorable + slot_favorable
+                caution = day_caution + slot_caution
+                windows.append(MuhuratWindowCandidate(
                     date=current_date,
                     start_time=current_slot,
                     end_time=slot_end,
-                    duration_minutes=slot_duration,
+                    duration_minutes=SLOT_DURATION_MINUTES,
                     score=score,
                     quality=get_quality_label(score),
                     tithi=panchang_data.tithi.name,
@@ -401,16 +742,16 @@ async def search_muhurat(request: MuhuratSearchRequest):
                     overlaps_rahu_kalam=rahu_conflict,
                     overlaps_yamagandam=yama_conflict
                 ))
-            
-            current_slot += timedelta(minutes=30)  # 30-minute increments
-        
-        current_date += timedelta(days=1)
     
-    # Sort by score (descending)
-    windows.sort(key=lambda w: w.score, reverse=True)
+    # Keep the top-scoring windows (descending, stable for equal scores) and
+    # only validate those as MuhuratWindow models
+    top_windows = MUHURAT_WINDOWS_ADAPTER.validate_python(
+        heapq.nlargest(MAX_WINDOWS, windows, key=lambda w: w.score),
+        from_attributes=True
+    )
     
     # Get best window
-    best_window = windows[0] if windows else None
+    best_window = top_windows[0] if top_windows else None
     
     return MuhuratSearchResponse(
         event_type=request.event_type,
@@ -423,7 +764,7 @@ async def search_muhurat(request: MuhuratSearchRequest):
             "avoid_bhadra": request.avoid_bhadra,
             "exclude_nakshatras": request.exclude_nakshatras
         },
-        windows=windows[:50],  # Limit to top 50
+        windows=top_windows,
         total_found=len(windows),
         best_window=best_window
     )
@@ -445,19 +786,12 @@ async def quick_muhurat_check(
     if date_val is None:
         date_val = date.today()
     
-    panchang_service = PanchangService()
-    panchang_data = panchang_service.get_panchang(
-        date_val=date_val,
-        latitude=latitude,
-        longitude=longitude,
-        timezone_str=timezone
-    )
+    panchang_data = await compute_panchang(date_val, latitude, longitude, timezone)
     
     # Calculate base score
     score, favorable, caution = calculate_muhurat_score(
         panchang_data, event_type,
-        panchang_data.sunrise, panchang_data.sunset,
-        {}
+        panchang_data.sunrise, panchang_data.sunset
     )
     
     is_suitable = score >= 50
@@ -491,7 +825,7 @@ async def quick_muhurat_check(
             "reason": "Early morning hours are generally auspicious"
         })
     
-    summary = f"{'Suitable' if is_suitable else 'Not ideal'} for {event_type.value}. "
+    summary = f"{'Suitable' if is_suitable else 'Not ideal'} for {EVENT_TYPE_VALUES[event_type]}. "
     if favorable:
         summary += favorable[0] + ". "
     if caution:
@@ -530,39 +864,16 @@ async def today_muhurat(
     return await search_muhurat(request)
 
 
-@router.get("/event-types")
+@router.get("/event-types", response_class=Response)
 async def list_event_types():
     """
     List all supported event types with descriptions.
     """
-    descriptions = {
-        EventType.MARRIAGE: "Wedding ceremonies and marriage rituals",
-        EventType.ENGAGEMENT: "Engagement ceremonies and ring exchange",
-        EventType.GRIHA_PRAVESH: "House warming and entering new home",
-        EventType.VEHICLE_PURCHASE: "Buying new vehicles, first drive",
-        EventType.BUSINESS_OPENING: "Starting new business, shop opening",
-        EventType.EDUCATION_START: "Starting education, joining school/college",
-        EventType.TRAVEL: "Long journeys, important trips",
-        EventType.SURGERY: "Medical procedures and operations",
-        EventType.NAMING_CEREMONY: "Naming ceremony for newborn",
-        EventType.PROPERTY_PURCHASE: "Buying land or property",
-        EventType.GOLD_PURCHASE: "Buying gold and jewelry",
-        EventType.INVESTMENT: "Financial investments and contracts",
-        EventType.JOB_JOINING: "Starting new job or position",
-        EventType.FOUNDATION_LAYING: "Laying foundation for construction",
-        EventType.MUNDAN: "First haircut ceremony for children",
-        EventType.ANNAPRASHAN: "First solid food ceremony for infants",
-        EventType.UPANAYANA: "Sacred thread ceremony",
-    }
-    
-    return [
-        {
-            "type": event_type.value,
-            "name": event_type.value.replace("_", " ").title(),
-            "description": descriptions.get(event_type, "")
-        }
-        for event_type in EventType
-    ]
+    return Response(
+        content=EVENT_TYPES_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
 
 
 @router.get("/auspicious-days")
@@ -579,8 +890,6 @@ async def get_auspicious_days(
     
     Returns days ranked by overall auspiciousness or suitability for specific event.
     """
-    panchang_service = PanchangService()
-    
     # Get days in month
     if month == 12:
         next_month = date(year + 1, 1, 1)
@@ -588,22 +897,21 @@ async def get_auspicious_days(
         next_month = date(year, month + 1, 1)
     
     first_day = date(year, month, 1)
-    num_days = (next_month - first_day).days
+    last_day = next_month - timedelta(days=1)
     
     auspicious_days = []
     
-    for day in range(1, num_days + 1):
-        current_date = date(year, month, day)
-        
-        panchang_data = panchang_service.get_panchang(
-            date_val=current_date,
-            latitude=latitude,
-            longitude=longitude,
-            timezone_str=timezone
-        )
-        
+    panchang_by_day = await fetch_panchang_range(
+        first_day,
+        last_day,
+        latitude=latitude,
+        longitude=longitude,
+        timezone_str=timezone
+    )
+    
+    for current_date, panchang_data in panchang_by_day:
         # Skip clearly inauspicious days
-        if panchang_data.tithi.number in AVOID_TITHIS["amavasya"]:
+        if panchang_data.tithi.number in AVOID_TITHIS_SET["amavasya"]:
             continue
         if panchang_data.karana.is_vishti:
             continue
@@ -612,8 +920,7 @@ async def get_auspicious_days(
         if event_type:
             score, favorable, caution = calculate_muhurat_score(
                 panchang_data, event_type,
-                panchang_data.sunrise, panchang_data.sunset,
-                {}
+                panchang_data.sunrise, panchang_data.sunset
             )
         else:
             # General auspiciousness score
@@ -622,19 +929,20 @@ async def get_auspicious_days(
             caution = []
             
             # Nakshatra based
-            if panchang_data.nakshatra.name in NAKSHATRA_CLASSIFICATIONS["movable"]:
+            nakshatra_bit = NAKSHATRA_BITS.get(panchang_data.nakshatra.name, 0)
+            if NAKSHATRA_CLASSIFICATION_BITS["movable"] & nakshatra_bit:
                 score += 15
-                favorable.append("Chara (movable) nakshatra")
-            elif panchang_data.nakshatra.name in NAKSHATRA_CLASSIFICATIONS["soft"]:
+                favorable.append(REASON_MOVABLE_NAKSHATRA)
+            elif NAKSHATRA_CLASSIFICATION_BITS["soft"] & nakshatra_bit:
                 score += 10
-                favorable.append("Mridu (soft) nakshatra")
+                favorable.append(REASON_SOFT_NAKSHATRA)
             
             # Tithi based
-            if panchang_data.tithi.number not in AVOID_TITHIS["rikta"]:
+            if panchang_data.tithi.number not in AVOID_TITHIS_SET["rikta"]:
                 score += 10
             
             # Yoga based
-            if panchang_data.yoga.number in [1, 2, 3, 6, 7, 11, 13]:
+            if panchang_data.yoga.number in GENERAL_AUSPICIOUS_YOGAS:
                 score += 10
                 favorable.append(f"{panchang_data.yoga.name} yoga")
         
@@ -656,7 +964,7 @@ async def get_auspicious_days(
     return {
         "year": year,
         "month": month,
-        "event_type": event_type.value if event_type else "general",
+        "event_type": EVENT_TYPE_VALUES[event_type] if event_type else "general",
         "auspicious_days": auspicious_days,
         "total_found": len(auspicious_days)
     }
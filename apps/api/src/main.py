@@ -1,94 +1,303 @@
 """Jyotish Platform API - Simple Working Version"""
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.constants import REF_PREFIX
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
 from datetime import datetime
 import os
+import time
 
-app = FastAPI(title="Jyotish Platform API", version="1.0.0")
+import orjson
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+class Clock:
+    """
+    Current date/time strings, reformatted at most once a second instead of per request.
+
+    Refreshed when read, so it needs no background task and stays current whether or
+    not the server runs the app's lifespan.
+    """
+
+    MAX_AGE = 1.0  # seconds
+
+    def __init__(self):
+        self.refresh()
+
+    def refresh(self):
+        self.refreshed_at = time.monotonic()
+        self._today = datetime.now().strftime("%Y-%m-%d")
+        self._utc_iso = datetime.utcnow().isoformat()
+
+    def check(self):
+        if time.monotonic() - self.refreshed_at > self.MAX_AGE:
+            self.refresh()
+
+    @property
+    def today(self) -> str:
+        self.check()
+        return self._today
+
+    @property
+    def utc_iso(self) -> str:
+        self.check()
+        return self._utc_iso
+
+clock = Clock()
+
+app = FastAPI(
+    title="Jyotish Platform API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
-@app.get("/")
-def root():
-    return {"message": "Jyotish Platform API", "status": "running"}
-
-@app.get("/health")
-def health():
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
-
-@app.get("/api/v1/panchang")
-def get_panchang(date: str = None, lat: float = 13.0827, lon: float = 80.2707):
-    return {
-        "date": date or datetime.now().strftime("%Y-%m-%d"),
-        "tithi": {"name": "Shukla Panchami", "end_time": "14:32"},
-        "nakshatra": {"name": "Rohini", "end_time": "18:45"},
-        "yoga": {"name": "Shubha", "end_time": "12:15"},
-        "karana": {"name": "Bava", "end_time": "14:32"},
-        "vara": "Sunday",
-        "sunrise": "06:42",
-        "sunset": "18:15",
-        "rahu_kaal": {"start": "09:00", "end": "10:30"},
-        "abhijit_muhurat": {"start": "12:02", "end": "12:48"},
-    }
-
-@app.get("/api/v1/horoscope/{sign}")
-def get_horoscope(sign: str):
-    return {
+CORS_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+class FastCORSMiddleware:
+    """
+    CORS for a public API: every origin, method and header, with credentials.
+
+    Responds exactly like CORSMiddleware(allow_origins=["*"], allow_credentials=True,
+    allow_methods=["*"], allow_headers=["*"]), but with the header tuples precomputed,
+    so most responses only get two headers appended.
+    """
+
+    SIMPLE_HEADERS = [
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-credentials", b"true"),
+    ]
+    PREFLIGHT_HEADERS = [
+        (b"vary", b"Origin"),
+        (b"access-control-allow-methods", ", ".join(CORS_METHODS).encode()),
+        (b"access-control-max-age", b"600"),
+        (b"access-control-allow-credentials", b"true"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"cookie":
+                has_cookie = True
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight(send, origin, request_method, request_headers)
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Copy: a shared Response object hands out its own header list
+                message["headers"] = list(message.get("headers", ())) + self.SIMPLE_HEADERS
+                if has_cookie:
+                    # Credentialed requests need the explicit origin instead of "*"
+                    headers = MutableHeaders(scope=message)
+                    headers["Access-Control-Allow-Origin"] = origin.decode("latin-1")
+                    headers.add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight(self, send, origin, request_method, request_headers):
+        headers = self.PREFLIGHT_HEADERS + [(b"access-control-allow-origin", origin)]
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        if request_method.decode("latin-1") in CORS_METHODS:
+            status, body = 200, b"OK"
+        else:
+            status, body = 400, b"Disallowed CORS method"
+
+        headers.append((b"content-length", str(len(body)).encode()))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+app.add_middleware(FastCORSMiddleware)
+
+FIELD = object()  # marks a per-request value in a JSONTemplate payload
+
+class JSONTemplate:
+    """JSON body serialized once at import; only FIELD values are encoded per request."""
+
+    def __init__(self, payload: dict):
+        self.fields = [key for key, value in payload.items() if value is FIELD]
+        body = orjson.dumps({key: f"__{key}__" if value is FIELD else value for key, value in payload.items()})
+        self.parts = []
+        for key in self.fields:
+            head, body = body.split(f'"__{key}__"'.encode(), 1)
+            self.parts.append(head)
+        self.parts.append(body)
+
+    def render(self, **values) -> Response:
+        chunks = [self.parts[0]]
+        for key, part in zip(self.fields, self.parts[1:]):
+            chunks.append(orjson.dumps(values[key]))
+            chunks.append(part)
+        return Response(content=b"".join(chunks), media_type="application/json")
+
+PANCHANG_TEMPLATE = JSONTemplate({
+    "date": FIELD,
+    "tithi": {"name": "Shukla Panchami", "end_time": "14:32"},
+    "nakshatra": {"name": "Rohini", "end_time": "18:45"},
+    "yoga": {"name": "Shubha", "end_time": "12:15"},
+    "karana": {"name": "Bava", "end_time": "14:32"},
+    "vara": "Sunday",
+    "sunrise": "06:42",
+    "sunset": "18:15",
+    "rahu_kaal": {"start": "09:00", "end": "10:30"},
+    "abhijit_muhurat": {"start": "12:02", "end": "12:48"},
+})
+
+CHART_TEMPLATE = JSONTemplate({
+    "name": FIELD,
+    "ascendant": {"sign": "Capricorn", "degree": 15.5},
+    "moon_sign": "Pisces",
+    "sun_sign": "Capricorn",
+    "planets": [
+        {"name": "Sun", "sign": "Capricorn", "house": 1},
+        {"name": "Moon", "sign": "Pisces", "house": 3},
+        {"name": "Mars", "sign": "Cancer", "house": 7},
+        {"name": "Mercury", "sign": "Capricorn", "house": 1},
+        {"name": "Jupiter", "sign": "Virgo", "house": 9},
+        {"name": "Venus", "sign": "Capricorn", "house": 1},
+        {"name": "Saturn", "sign": "Scorpio", "house": 11},
+        {"name": "Rahu", "sign": "Taurus", "house": 5},
+        {"name": "Ketu", "sign": "Scorpio", "house": 11},
+    ],
+})
+
+MATCH_TEMPLATE = JSONTemplate({
+    "person1": FIELD,
+    "person2": FIELD,
+    "total_points": 28,
+    "max_points": 36,
+    "percentage": 77.8,
+    "verdict": "Good Match",
+})
+
+MUHURAT_TEMPLATE = JSONTemplate({
+    "type": FIELD,
+    "date": FIELD,
+    "muhurats": [
+        {"start": "06:30", "end": "08:00", "quality": "Excellent"},
+        {"start": "10:15", "end": "11:45", "quality": "Good"},
+    ],
+})
+
+HEALTH_TEMPLATE = JSONTemplate({"status": "healthy", "timestamp": FIELD})
+
+# Western sign names, then the Sanskrit rashi names (as used by the web client)
+SIGNS = (
+    "aries", "taurus", "gemini", "cancer", "leo", "virgo",
+    "libra", "scorpio", "sagittarius", "capricorn", "aquarius", "pisces",
+    "mesha", "vrishabha", "mithuna", "karka", "simha", "kanya",
+    "tula", "vrishchika", "dhanu", "makara", "kumbha", "meena",
+)
+
+HOROSCOPE_TEMPLATES = {
+    sign: JSONTemplate({
         "sign": sign.capitalize(),
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "date": FIELD,
         "prediction": f"Today is favorable for {sign.capitalize()}. Focus on your goals.",
         "lucky_number": 7,
         "lucky_color": "Blue",
-    }
-
-@app.post("/api/v1/chart")
-def generate_chart(name: str = "User", date: str = "1990-01-15", time: str = "12:00", lat: float = 13.0827, lon: float = 80.2707):
-    return {
-        "name": name,
-        "ascendant": {"sign": "Capricorn", "degree": 15.5},
-        "moon_sign": "Pisces",
-        "sun_sign": "Capricorn",
-        "planets": [
-            {"name": "Sun", "sign": "Capricorn", "house": 1},
-            {"name": "Moon", "sign": "Pisces", "house": 3},
-            {"name": "Mars", "sign": "Cancer", "house": 7},
-            {"name": "Mercury", "sign": "Capricorn", "house": 1},
-            {"name": "Jupiter", "sign": "Virgo", "house": 9},
-            {"name": "Venus", "sign": "Capricorn", "house": 1},
-            {"name": "Saturn", "sign": "Scorpio", "house": 11},
-            {"name": "Rahu", "sign": "Taurus", "house": 5},
-            {"name": "Ketu", "sign": "Scorpio", "house": 11},
-        ],
-    }
-
-@app.post("/api/v1/match")
-def check_match(person1: str = "Person 1", person2: str = "Person 2"):
-    return {
-        "person1": person1,
-        "person2": person2,
-        "total_points": 28,
-        "max_points": 36,
-        "percentage": 77.8,
-        "verdict": "Good Match",
-    }
-
-@app.get("/api/v1/muhurat")
-def find_muhurat(type: str = "marriage"):
-    return {
-        "type": type,
-        "date": datetime.now().strftime("%Y-%m-%d"),
-        "muhurats": [
-            {"start": "06:30", "end": "08:00", "quality": "Excellent"},
-            {"start": "10:15", "end": "11:45", "quality": "Good"},
-        ],
-    }
+    })
+    for sign in SIGNS
+}
+
+ROOT_RESPONSE = Response(
+    content=orjson.dumps({"message": "Jyotish Platform API", "status": "running"}),
+    media_type="application/json",
+)
+
+@app.get("/", response_class=Response)
+async def root():
+    return ROOT_RESPONSE
+
+@app.get("/health", response_class=Response)
+async def health():
+    return HEALTH_TEMPLATE.render(timestamp=clock.utc_iso)
+
+# get_panchang reads its query string directly instead of through FastAPI's parameter
+# parsing; this keeps the parameters and the 422 response in the generated docs.
+PANCHANG_OPENAPI = {
+    "parameters": [
+        {"name": "date", "in": "query", "required": False, "schema": {"type": "string", "title": "Date"}},
+        {"name": "lat", "in": "query", "required": False, "schema": {"type": "number", "default": 13.0827, "title": "Lat"}},
+        {"name": "lon", "in": "query", "required": False, "schema": {"type": "number", "default": 80.2707, "title": "Lon"}},
+    ],
+    "responses": {
+        "422": {
+            "description": "Validation Error",
+            "content": {"application/json": {"schema": {"$ref": f"{REF_PREFIX}HTTPValidationError"}}},
+        },
+    },
+}
+
+@app.get("/api/v1/panchang", response_class=Response, openapi_extra=PANCHANG_OPENAPI)
+async def get_panchang(request: Request):
+    query = request.query_params
+    errors = []
+    for name in ("lat", "lon"):
+        value = query.get(name)
+        if value is not None:
+            try:
+                float(value)
+            except ValueError:
+                errors.append({
+                    "type": "float_parsing",
+                    "loc": ("query", name),
+                    "msg": "Input should be a valid number, unable to parse string as a number",
+                    "input": value,
+                })
+    if errors:
+        raise RequestValidationError(errors)
+    return PANCHANG_TEMPLATE.render(date=query.get("date") or clock.today)
+
+@app.get("/api/v1/horoscope/{sign}", response_class=Response)
+async def get_horoscope(sign: str):
+    template = HOROSCOPE_TEMPLATES.get(sign.lower())
+    if template is None:
+        raise HTTPException(status_code=404, detail=f"Unknown zodiac sign: {sign}")
+    return template.render(date=clock.today)
+
+@app.post("/api/v1/chart", response_class=Response)
+async def generate_chart(name: str = "User", date: str = "1990-01-15", time: str = "12:00", lat: float = 13.0827, lon: float = 80.2707):
+    return CHART_TEMPLATE.render(name=name)
+
+@app.post("/api/v1/match", response_class=Response)
+async def check_match(person1: str = "Person 1", person2: str = "Person 2"):
+    return MATCH_TEMPLATE.render(person1=person1, person2=person2)
+
+@app.get("/api/v1/muhurat", response_class=Response)
+async def find_muhurat(type: str = "marriage"):
+    return MUHURAT_TEMPLATE.render(type=type, date=clock.today)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", 8000)))
+    # Single worker by default (local runs); set WEB_CONCURRENCY to fork more, as with
+    # the uvicorn CLI used in production. Multiple workers need an import string,
+    # which must match how this module was started (python -m src.main or python main.py).
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    port = int(os.environ.get("PORT", 8000))
+    if workers == 1:
+        uvicorn.run(app, host="0.0.0.0", port=port)
+    else:
+        target = f"{__spec__.name}:app" if __spec__ else "main:app"
+        uvicorn.run(target, host="0.0.0.0", port=port, workers=workers)